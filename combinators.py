@@ -1,3 +1,6 @@
+import collections
+import threading
+from concurrent.futures import Future
 from typing import Generic
 from collections.abc import Iterable, Callable
 
@@ -8,9 +11,30 @@ class UnionMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT
     """A machine whose set of transitions is the union of an ordered sequence of other machines.
 
     If more than one machine results in a transition in a given state, the first one takes precedence.
+
+    A machine may declare the input types it handles by overriding `StateMachine.handled_input_types`. Inputs are then
+    dispatched through a table keyed on `type(input)` instead of probing every machine, so `input` costs one dict
+    lookup plus the machines registered for that type. Machines that don't declare their input types ("wildcards") are
+    probed for every input, interleaved with the declared machines in their original precedence order.
     """
     def __init__(self, machines: Iterable[StateMachine[StateT, InputT, OutputT]]) -> None:
-        self._machines = machines
+        self._machines = tuple(machines)
+        if not self._machines:
+            raise ValueError("UnionMachine requires at least one machine.")
+        declared = [
+            types if types is None else frozenset(types)
+            for types in (machine.handled_input_types() for machine in self._machines)
+        ]
+        input_types = {input_type for types in declared if types is not None for input_type in types}
+        self._wildcard = tuple(machine for machine, types in zip(self._machines, declared) if types is None)
+        self._by_input_type: dict[type, tuple[StateMachine[StateT, InputT, OutputT], ...]] = {
+            input_type: tuple(
+                machine
+                for machine, types in zip(self._machines, declared)
+                if types is None or input_type in types
+            )
+            for input_type in input_types
+        }
 
     def startup(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         """Pick the first machine that results in a transition or None if none of them do."""
@@ -22,7 +46,8 @@ class UnionMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT
 
     def input(self, state: StateT, input: InputT) -> StateTransition[StateT, OutputT] | None:
         """Pick the first machine that results in a transition or None if node of them do."""
-        for machine in self._machines:
+        machines = self._by_input_type.get(type(input))
+        for machine in machines if machines is not None else self._wildcard:
             transition = machine.input(state=state, input=input)
             if transition:
                 return transition
@@ -38,11 +63,32 @@ class UnionMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT
 
 
 class SupressInputMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT, OutputT]):
-    """Act like other machine but ignore all inputs satisfying a predicate."""
+    """Act like other machine but ignore all inputs satisfying a predicate.
+
+    The predicate may be:
+      * a callable `InputT -> bool`
+      * a `set`/`frozenset` of inputs to ignore
+      * an input type, or tuple of input types, to ignore
+    The set and type forms dispatch straight to the C-level containment/isinstance check, skipping one Python-level
+    call frame per event.
+    """
 
-    def __int__(self, machine: StateMachine[StateT, InputT, OutputT], ignore_input: Callable[[InputT], bool]) -> None:
+    def __init__(
+        self,
+        machine: StateMachine[StateT, InputT, OutputT],
+        ignore_input: Callable[[InputT], bool] | frozenset[InputT] | set[InputT] | type | tuple[type, ...],
+    ) -> None:
         self._machine = machine
-        self._ignore_input = ignore_input
+        if isinstance(ignore_input, (set, frozenset)):
+            self._ignore_set = frozenset(ignore_input)
+            self.input = self._input_set
+        elif isinstance(ignore_input, type) or (
+            isinstance(ignore_input, tuple) and ignore_input and all(isinstance(t, type) for t in ignore_input)
+        ):
+            self._ignore_types = ignore_input
+            self.input = self._input_isinstance
+        else:
+            self._ignore_input = ignore_input
 
     def startup(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         return self._machine.startup(state=state)
@@ -52,12 +98,26 @@ class SupressInputMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT,
             return None
         return self._machine.input(state=state, input=input)
 
+    def _input_set(self, state: StateT, input: InputT) -> StateTransition[StateT, OutputT] | None:
+        if input in self._ignore_set:
+            return None
+        return self._machine.input(state=state, input=input)
+
+    def _input_isinstance(self, state: StateT, input: InputT) -> StateTransition[StateT, OutputT] | None:
+        if isinstance(input, self._ignore_types):
+            return None
+        return self._machine.input(state=state, input=input)
+
     def quiesce(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         return self._machine.quiesce(state=state)
 
 
 class InitialInputMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT, OutputT]):
-    """Send an initial input to a machine and otherwise act like that machine."""
+    """Send an initial input to a machine and otherwise act like that machine.
+
+    After the initial input has been delivered, the instance rebinds `startup`/`input`/`quiesce` to the wrapped
+    machine's methods, so the wrapper drops out of the dispatch chain entirely.
+    """
 
     def __init__(self, machine: StateMachine[StateT, InputT, OutputT], initial_input: InputT) -> None:
         self._machine = machine
@@ -76,12 +136,22 @@ class InitialInputMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT,
     def _initialize(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         if not self._initialized:
             self._initialized = True
+            # Subsequent events delegate straight to the wrapped machine, skipping the initialization check and
+            # the _concatenate(None, ...) hop.
+            self.startup = self._machine.startup
+            self.input = self._machine.input
+            self.quiesce = self._machine.quiesce
             return self._machine.process_input(state=state, input=self._initial_input)
         return None
 
 
 class StoppingMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT, OutputT]):
-    """Act like some other machine until reaching a final state, and then do nothing."""
+    """Act like some other machine until reaching a final state, and then do nothing.
+
+    The final state is assumed to be terminal: once `until(state)` returns True it must return True for every state
+    this instance sees afterwards. On first terminal entry the instance rebinds `startup`/`input`/`quiesce` to a
+    no-op, so stopped machines cost nothing per event.
+    """
 
     def __init__(self, machine: StateMachine[StateT, InputT, OutputT], until: Callable[[StateT], bool]) -> None:
         self._machine = machine
@@ -89,17 +159,94 @@ class StoppingMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, Inp
 
     def startup(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         if self._until(state):
+            self._stop()
             return None
         return self._machine.startup(state=state)
 
     def input(self, state: StateT, input: InputT) -> StateTransition[StateT, OutputT] | None:
         if self._until(state):
+            self._stop()
             return None
         return self._machine.input(state=state, input=input)
 
     def quiesce(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
         if self._until(state):
+            self._stop()
             return None
         return self._machine.quiesce(state=state)
 
+    def _stop(self) -> None:
+        self.startup = self.quiesce = self._noop
+        self.input = self._noop_input
+
+    @staticmethod
+    def _noop(state: StateT) -> None:
+        return None
+
+    @staticmethod
+    def _noop_input(state: StateT, input: InputT) -> None:
+        return None
+
+
+class QueuedMachine(Generic[StateT, InputT, OutputT], StateMachine[StateT, InputT, OutputT]):
+    """Serialize `process_input` calls to a machine through a single worker thread.
+
+    Concurrent callers of `process_input` on a shared machine would otherwise interleave the input transition and its
+    quiescence. Rather than locking around every method — which would also stall read-only introspection — events are
+    enqueued and a single consumer drives the wrapped machine one event at a time. The lock guards only the queue, not
+    the transitions themselves.
+
+    `process_input` returns a `Future` resolving to the wrapped machine's transition (or its exception).
+    `startup`/`input`/`quiesce` delegate to the wrapped machine directly and stay lock-free. Call `close` to drain the
+    queue and stop the worker.
+    """
+
+    def __init__(self, machine: StateMachine[StateT, InputT, OutputT]) -> None:
+        self._machine = machine
+        self._queue: collections.deque = collections.deque()
+        self._has_work = threading.Condition(threading.Lock())
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def process_input(self, state: StateT, input: InputT) -> "Future[StateTransition[StateT, OutputT] | None]":
+        future: Future = Future()
+        with self._has_work:
+            if self._closed:
+                raise RuntimeError("QueuedMachine is closed.")
+            self._queue.append((state, input, future))
+            self._has_work.notify()
+        return future
+
+    def close(self) -> None:
+        """Process the events already queued, then stop the worker thread."""
+        with self._has_work:
+            self._closed = True
+            self._has_work.notify()
+        self._worker.join()
+
+    def startup(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
+        return self._machine.startup(state=state)
+
+    def input(self, state: StateT, input: InputT) -> StateTransition[StateT, OutputT] | None:
+        return self._machine.input(state=state, input=input)
+
+    def quiesce(self, state: StateT) -> StateTransition[StateT, OutputT] | None:
+        return self._machine.quiesce(state=state)
 
+    def _run(self) -> None:
+        while True:
+            with self._has_work:
+                while not self._queue and not self._closed:
+                    self._has_work.wait()
+                if not self._queue:
+                    return
+                state, input, future = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                # The caller cancelled the future while it was still queued; skip it.
+                continue
+            # The transition runs outside the lock: only the queue is synchronized.
+            try:
+                future.set_result(self._machine.process_input(state=state, input=input))
+            except BaseException as error:  # noqa: BLE001 - delivered through the future
+                future.set_exception(error)
@@ -46,18 +46,25 @@ To understand the second part of the `ModeMachines`, consider a scenario in whic
 to `STOPPED` mode, you want to finish the pick in progress before actually transitioning into `STOPPED`. Then you would
 arrange `can_transition_to_target_mode(state, RUNNING, STOPPED)` to return `None` if `state` represents a state in
 which there is a pick in progress.
+
+Modes are compared and hashed on every input, so prefer `int` / `enum.IntEnum` modes: when `ModeMachines.all_modes`
+reports an all-integer mode set, `ModalMachine` packs its (current_mode, target_mode) cache keys into a single small
+integer, making steady-state dispatch one int hash, one dict lookup, and one underlying method call.
 """
 
 import abc
 from typing import Generic, TypeVar
+from collections.abc import Callable, Iterable
 
 from state_machine import StateT, InputT, OutputT, StateMachine, StateTransition
 import attr
 
 ModeT = TypeVar("ModeT")
 
+_MISSING = object()
+
 
-@attr.s(frozen=True, kw_only=True)
+@attr.s(frozen=True, kw_only=True, slots=True)
 class ModalState(Generic[StateT, ModeT]):
     state: StateT = attr.ib()
     current_mode: ModeT = attr.ib()
@@ -67,7 +74,7 @@ class ModalState(Generic[StateT, ModeT]):
         if isinstance(self.state, ModalState):
             return self.state._test_mode()
         if hasattr(self.state, "_test_mode"):
-            return self.state._test_mode # Type: ignore
+            return self.state._test_mode()  # type: ignore
         return False
 
     def transition_to_target_mode(self, next_target_mode: ModeT | None) -> "ModalState[StateT, ModeT] | None":
@@ -75,49 +82,48 @@ class ModalState(Generic[StateT, ModeT]):
         target_mode = next_target_mode or self.target_mode
         if self.current_mode == current_mode and self.target_mode == target_mode:
             return None
-        if self._test_mode():
+        if __debug__ and self._test_mode():
             print(f"{current_mode=} {target_mode=}.")
-        return attr.evolve(self, current_mode=current_mode, target_mode=target_mode)
+        return ModalState(state=self.state, current_mode=current_mode, target_mode=target_mode)
 
     def with_target_mode(self, target_mode: ModeT) -> "ModalState[StateT, ModeT] | None":
         if self.target_mode == target_mode:
             return None
-        if self._test_mode():
+        if __debug__ and self._test_mode():
             print(f"{target_mode=}.")
-        return attr.evolve(self, target_mode=target_mode)
+        return ModalState(state=self.state, current_mode=self.current_mode, target_mode=target_mode)
 
 
 class ModalInput(Generic[InputT, ModeT]):
-    pass
+    __slots__ = ()
 
 
-@attr.s(frozen=True, kw_only=True)
+@attr.s(frozen=True, kw_only=True, slots=True)
 class Input(Generic[InputT, ModeT], ModalInput[InputT, ModeT]):
     input: InputT = attr.ib()
 
 
-@attr.s(fronzen=True, kw_only=True)
+@attr.s(frozen=True, kw_only=True, slots=True)
 class ModeInput(Generic[InputT, ModeT], ModalInput[InputT, ModeT]):
     target_mode: ModeT = attr.ib()
 
 
 class ModalOutput(Generic[OutputT, ModeT]):
-    current_mode: ModeT = attr.ib()
-    target_mode: ModeT = attr.ib()
+    __slots__ = ()
 
 
-@attr.s(frozen=True, kw_only=True)
+@attr.s(frozen=True, kw_only=True, slots=True)
 class Output(Generic[OutputT, ModeT], ModalOutput[OutputT, ModeT]):
     output: OutputT = attr.ib()
 
 
-@attr.s(frozen=True, kw_only=True)
-class ModeOutput(Generic[InputT, ModeT], ModalOutput[OutputT, ModeT]):
+@attr.s(frozen=True, kw_only=True, slots=True)
+class ModeOutput(Generic[OutputT, ModeT], ModalOutput[OutputT, ModeT]):
     current_mode: ModeT = attr.ib()
     target_mode: ModeT = attr.ib()
 
 
-@attr.s(frozen=True, kw_only=True)
+@attr.s(frozen=True, kw_only=True, slots=True)
 class TransitionAllowed(Generic[ModeT]):
     next_target_mode: ModeT | None = attr.ib(default=None)
 
@@ -137,6 +143,14 @@ class ModeMachines(Generic[StateT, ModeT, InputT, OutputT], abc.ABC):
           * `TransitionAllowed(next_target_mode=t)`: Allowed transition to `(current_mode=target_mode, target_mode=t)`.
         """
 
+    def all_modes(self) -> Iterable[ModeT] | None:
+        """Enumerate the full set of modes, or `None` if the set cannot be enumerated.
+
+        When the modes are enumerable, `ModalMachine` precomputes the mode machine for every (current_mode,
+        target_mode) pair at construction, so runtime lookups never fall back to `mode_machine`.
+        """
+        return None
+
 
 class ModalMachine(
     Generic[StateT, ModeT, InputT, OutputT],
@@ -144,10 +158,37 @@ class ModalMachine(
 ):
     def __init__(self, mode_machines: ModeMachines[StateT, ModeT, InputT, OutputT]) -> None:
         self._mode_machines = mode_machines
+        # Modes form a small finite set, so the cache is bounded by M^2 entries for M modes.
+        self._machine_cache: dict[tuple[ModeT, ModeT] | int, StateMachine[StateT, InputT, OutputT] | None] = {}
+        self._mode_key: Callable[[ModeT, ModeT], tuple[ModeT, ModeT] | int] = (
+            lambda current_mode, target_mode: (current_mode, target_mode)
+        )
+        self._prime_machine_cache()
+
+    def invalidate(self) -> None:
+        """Discard cached mode-machine lookups after the `ModeMachines` mapping changes dynamically."""
+        self._machine_cache.clear()
+        self._prime_machine_cache()
+
+    def _prime_machine_cache(self) -> None:
+        # With an enumerable mode set, fill the whole table up front so every runtime lookup is a cache hit and
+        # invalid pairs are a plain dict hit on a cached None.
+        modes = self._mode_machines.all_modes()
+        if modes is None:
+            return
+        modes = tuple(modes)
+        if all(isinstance(mode, int) and 0 <= mode < 1 << 16 for mode in modes):
+            # IntEnum members hash as their value, so a packed key costs one small-int hash per lookup.
+            self._mode_key = lambda current_mode, target_mode: (current_mode << 16) | target_mode
+        for current_mode in modes:
+            for target_mode in modes:
+                self._machine_cache[self._mode_key(current_mode, target_mode)] = self._mode_machines.mode_machine(
+                    current_mode=current_mode, target_mode=target_mode,
+                )
 
     def startup(self, state: ModalState[StateT, ModeT]) -> StateTransition[StateT, OutputT] | None:
-        transition = self._transition_to_target_mode(state=state)
-        if not transition:
+        # Steady state (current_mode == target_mode) is the common case; skip the mode-transition machinery.
+        if state.current_mode != state.target_mode and not self._transition_to_target_mode(state=state):
             return None
         machine = self._mode_machine(state=state)
         if machine is None:
@@ -159,7 +200,8 @@ class ModalMachine(
     ) -> StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, ModeT]] | None:
         match input:
             case ModeInput(target_mode=m):
-                if self._is_invalid_mode_transition(state.current_mode, m):
+                # The mode transition is valid iff a corresponding mode machine is defined.
+                if self._cached_mode_machine(current_mode=state.current_mode, target_mode=m) is None:
                     print(f"Invalid mode transition, {state.current_mode} -> {m}")
                     return None
                 next_state = state.with_target_mode(target_mode=m)
@@ -167,12 +209,12 @@ class ModalMachine(
                     return None
                 return StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, StateT]](
                     state=state.state,
-                    outputs=[
+                    outputs=(
                         ModeOutput(
                             current_mode=next_state.current_mode,
                             target_mode=next_state.target_mode,
-                        )
-                    ],
+                        ),
+                    ),
                 )
             case Input(input=x):
                 machine = self._mode_machine(state=state)
@@ -182,17 +224,24 @@ class ModalMachine(
         raise TypeError(f"Unexpected input {input}.")
 
     def quiesce(self, state: ModalState[StateT, ModeT]) -> StateTransition[StateT, OutputT] | None:
-        transition = self._transition_to_target_mode(state=state)
-        if transition is None:
+        # Steady state (current_mode == target_mode) is the common case; skip the mode-transition machinery.
+        if state.current_mode != state.target_mode and not self._transition_to_target_mode(state=state):
             return None
         machine = self._mode_machine(state=state)
         if machine is None:
             return None
         return self._modal(state=state, transition=machine.quiesce(state=state.state))
 
-    def _is_invalid_mode_transition(self, current_mode: ModeT, target_mode: ModeT) -> bool:
-        # determines whether the mode transition is valid by whether a corresponding mode machine is defined
-        return self._mode_machines.mode_machine(current_mode=current_mode, target_mode=target_mode) is not None
+    def _cached_mode_machine(
+            self, current_mode: ModeT, target_mode: ModeT,
+    ) -> StateMachine[StateT, InputT, OutputT] | None:
+        key = self._mode_key(current_mode, target_mode)
+        machine = self._machine_cache.get(key, _MISSING)
+        if machine is _MISSING:
+            machine = self._machine_cache[key] = self._mode_machines.mode_machine(
+                current_mode=current_mode, target_mode=target_mode,
+            )
+        return machine
 
     def _transition_to_target_mode(
             self, state: ModalState[StateT, ModeT],
@@ -207,13 +256,13 @@ class ModalMachine(
             return None
         return StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, ModeT]](
             state=next_state,
-            outputs=[
-                ModeOutput(target_mode=next_state.target_mode, current_mode=next_state.current_mode)
-            ],
+            outputs=(
+                ModeOutput(target_mode=next_state.target_mode, current_mode=next_state.current_mode),
+            ),
         )
 
     def _mode_machine(self, state: ModalState[StateT, ModeT]) -> StateMachine[StateT, InputT, OutputT] | None:
-        return self._mode_machines.mode_machine(current_mode=state.current_mode, target_mode=state.target_mode)
+        return self._cached_mode_machine(current_mode=state.current_mode, target_mode=state.target_mode)
 
     @classmethod
     def _modal(
@@ -221,12 +270,16 @@ class ModalMachine(
     ) -> StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, ModeT]] | None:
         if not transition:
             return None
-        outputs = map(lambda output: Output[OutputT, ModeT](output=output), transition.outputs)
+        if transition.outputs:
+            outputs = tuple(Output[OutputT, ModeT](output=output) for output in transition.outputs)
+        else:
+            outputs = ()
         if transition.state is None:
+            # The machine stayed put and only emitted outputs — skip the ModalState allocation entirely.
             return StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, ModeT]](outputs=outputs)
-        return StateTransition[ModalState[ModalState, ModeT], ModalOutput[OutputT, ModeT]](
-            state=ModalState[StateT, ModeT](
-                state=state.state, current_mode=state.current_mode, target_mode=state.target_mode,
+        return StateTransition[ModalState[StateT, ModeT], ModalOutput[OutputT, ModeT]](
+            state=ModalState(
+                state=transition.state, current_mode=state.current_mode, target_mode=state.target_mode,
             ),
             outputs=outputs,
         )